@@ -8,107 +8,75 @@ La Ley de Ohm establece la relación entre voltaje (V), corriente (I) y resisten
 V = I * R
 
 Principios SOLID aplicados:
-- SRP (Principio de Responsabilidad Única): Cada clase tiene una única responsabilidad.
+- SRP (Principio de Responsabilidad Única): Cada función tiene una única responsabilidad.
 - OCP (Principio Abierto/Cerrado): Fácilmente extensible para nuevos tipos de cálculos.
-- LSP (Principio de Sustitución de Liskov): Las subclases pueden sustituir a la clase base.
-- ISP (Principio de Segregación de Interfaces): Interface simple para todas las calculadoras.
-- DIP (Principio de Inversión de Dependencias): Dependencias basadas en abstracciones.
+- ISP (Principio de Segregación de Interfaces): Todas las calculadoras comparten la misma firma simple.
 
 Posibles modificaciones futuras:
 - Agregar más tipos de cálculos relacionados con electricidad.
 - Implementar una interfaz gráfica de usuario (GUI).
 - Añadir funcionalidad para guardar y cargar resultados.
 - Incluir unidades de medida y conversiones entre ellas.
+
+Uso por lotes (requiere numpy y numba, ver ohm_batch.py):
+    python ley_ohm.py --batch mediciones.csv --tipo corriente
 """
 
-from abc import ABC, abstractmethod
+import argparse
+import re
 
-class CalculadoraOhm(ABC):
-    """
-    Clase base abstracta para todas las calculadoras de la Ley de Ohm.
-    
-    Esta clase define la interfaz común para todos los tipos de cálculos.
-    Siguiendo el principio ISP, mantenemos esta interfaz simple y enfocada.
-    """
-    
-    @abstractmethod
-    def calcular(self, *args):
-        """
-        Método abstracto para realizar el cálculo.
-        
-        Cada subclase debe implementar este método según su tipo de cálculo específico.
-        """
-        pass
-
-class CalculadorVoltaje(CalculadoraOhm):
+def calcular_voltaje(corriente: float, resistencia: float) -> float:
     """
     Calcula el voltaje usando la Ley de Ohm: V = I * R
+    
+    :param corriente: Corriente en amperios (A)
+    :param resistencia: Resistencia en ohmios (Ω)
+    :return: Voltaje en voltios (V)
     """
-    def calcular(self, corriente: float, resistencia: float) -> float:
-        """
-        Calcula el voltaje dada la corriente y la resistencia.
-        
-        :param corriente: Corriente en amperios (A)
-        :param resistencia: Resistencia en ohmios (Ω)
-        :return: Voltaje en voltios (V)
-        """
-        return corriente * resistencia
-
-class CalculadorCorriente(CalculadoraOhm):
+    return corriente * resistencia
+
+def calcular_corriente(voltaje: float, resistencia: float) -> float:
     """
     Calcula la corriente usando la Ley de Ohm: I = V / R
+    
+    :param voltaje: Voltaje en voltios (V)
+    :param resistencia: Resistencia en ohmios (Ω)
+    :return: Corriente en amperios (A)
     """
-    def calcular(self, voltaje: float, resistencia: float) -> float:
-        """
-        Calcula la corriente dado el voltaje y la resistencia.
-        
-        :param voltaje: Voltaje en voltios (V)
-        :param resistencia: Resistencia en ohmios (Ω)
-        :return: Corriente en amperios (A)
-        """
-        return voltaje / resistencia
-
-class CalculadorResistencia(CalculadoraOhm):
+    return voltaje / resistencia
+
+def calcular_resistencia(voltaje: float, corriente: float) -> float:
     """
     Calcula la resistencia usando la Ley de Ohm: R = V / I
-    """
-    def calcular(self, voltaje: float, corriente: float) -> float:
-        """
-        Calcula la resistencia dado el voltaje y la corriente.
-        
-        :param voltaje: Voltaje en voltios (V)
-        :param corriente: Corriente en amperios (A)
-        :return: Resistencia en ohmios (Ω)
-        """
-        return voltaje / corriente
-
-class FabricaCalculadoraOhm:
-    """
-    Fábrica para crear instancias de calculadoras de la Ley de Ohm.
-    
-    Esta clase implementa el patrón de diseño Factory, permitiendo la creación
-    de diferentes tipos de calculadoras sin exponer la lógica de instanciación.
     
-    Posible modificación: Agregar más tipos de calculadoras relacionadas con electricidad.
-    """
-    
-    @staticmethod
-    def crear_calculadora(tipo: str) -> CalculadoraOhm:
-        """
-        Crea y retorna una instancia de la calculadora especificada.
-        
-        :param tipo: Tipo de calculadora a crear ("voltaje", "corriente", o "resistencia")
-        :return: Instancia de la calculadora correspondiente
-        :raises ValueError: Si se proporciona un tipo de calculadora no válido
-        """
-        if tipo == "voltaje":
-            return CalculadorVoltaje()
-        elif tipo == "corriente":
-            return CalculadorCorriente()
-        elif tipo == "resistencia":
-            return CalculadorResistencia()
-        else:
-            raise ValueError("Tipo de calculadora no válido")
+    :param voltaje: Voltaje en voltios (V)
+    :param corriente: Corriente en amperios (A)
+    :return: Resistencia en ohmios (Ω)
+    """
+    return voltaje / corriente
+
+# Tabla de cálculos disponibles. Para agregar un nuevo tipo de cálculo basta con
+# registrar aquí su función.
+_CALCULADORAS = {
+    "voltaje": calcular_voltaje,
+    "corriente": calcular_corriente,
+    "resistencia": calcular_resistencia,
+}
+
+# Números decimales con signo y exponente opcionales, p. ej. 12, -0.5, .5 o 1e-3.
+# Se valida antes de llamar a float() para no depender de excepciones en cada error.
+_NUMERO_RE = re.compile(r'^\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*$')
+
+# Opciones del menú: tipo de cálculo y mensajes para pedir cada valor.
+_MENSAJE_CORRIENTE = "Ingrese la corriente (en amperios): "
+_MENSAJE_RESISTENCIA = "Ingrese la resistencia (en ohmios): "
+_MENSAJE_VOLTAJE = "Ingrese el voltaje (en voltios): "
+
+_OPCIONES = {
+    "1": ("voltaje", _MENSAJE_CORRIENTE, _MENSAJE_RESISTENCIA),
+    "2": ("corriente", _MENSAJE_VOLTAJE, _MENSAJE_RESISTENCIA),
+    "3": ("resistencia", _MENSAJE_VOLTAJE, _MENSAJE_CORRIENTE),
+}
 
 def mostrar_menu():
     """
@@ -132,12 +100,34 @@ def obtener_entrada(mensaje: str) -> float:
     Posible modificación: Agregar validación de rango para los valores ingresados.
     """
     while True:
-        try:
-            return float(input(mensaje))
-        except ValueError:
-            print("Por favor, ingrese un número válido.")
+        entrada = input(mensaje)
+        if _NUMERO_RE.match(entrada):
+            return float(entrada)
+        print("Por favor, ingrese un número válido.")
+
+def _crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Calculadora de la Ley de Ohm")
+    parser.add_argument("--batch", metavar="ARCHIVO.csv",
+                        help="procesa un archivo CSV de mediciones en lugar de mostrar el menú")
+    parser.add_argument("--tipo", choices=tuple(_CALCULADORAS), default="voltaje",
+                        help="tipo de cálculo a realizar con --batch (por defecto: voltaje)")
+    return parser
+
+def procesar_lote(ruta: str, tipo: str):
+    """
+    Procesa un archivo CSV de mediciones y muestra el resultado de cada una.
+    
+    :param ruta: Ruta del archivo CSV con dos valores por fila
+    :param tipo: Tipo de cálculo ("voltaje", "corriente", o "resistencia")
+    """
+    # Se importa aquí para que el modo interactivo no dependa de numpy ni numba
+    from ohm_batch import calcular_lote, leer_csv
+
+    valores1, valores2 = leer_csv(ruta)
+    for resultado in calcular_lote(tipo, valores1, valores2):
+        print(f"{resultado:.2f}")
 
-def main():
+def main(argv=None):
     """
     Función principal que ejecuta la lógica de la aplicación.
     
@@ -149,34 +139,36 @@ def main():
     - Agregar opciones para guardar resultados en un archivo.
     - Integrar con una base de datos para almacenar historial de cálculos.
     """
+    parser = _crear_parser()
+    args = parser.parse_args(argv)
+    if args.batch:
+        try:
+            procesar_lote(args.batch, args.tipo)
+        except ImportError:
+            parser.error("--batch requiere numpy y numba (pip install numpy numba)")
+        except (OSError, ValueError) as e:
+            parser.error(f"no se pudo procesar {args.batch}: {e}")
+        return
+
     while True:
         mostrar_menu()
         opcion = input("Seleccione una opción (1-4): ")
 
-        if opcion == "4":
-            print("Gracias por usar la calculadora de la Ley de Ohm. ¡Hasta luego!")
-            break
-
-        if opcion in ["1", "2", "3"]:
-            if opcion == "1":
-                tipo = "voltaje"
-                valor1 = obtener_entrada("Ingrese la corriente (en amperios): ")
-                valor2 = obtener_entrada("Ingrese la resistencia (en ohmios): ")
-            elif opcion == "2":
-                tipo = "corriente"
-                valor1 = obtener_entrada("Ingrese el voltaje (en voltios): ")
-                valor2 = obtener_entrada("Ingrese la resistencia (en ohmios): ")
-            else:
-                tipo = "resistencia"
-                valor1 = obtener_entrada("Ingrese el voltaje (en voltios): ")
-                valor2 = obtener_entrada("Ingrese la corriente (en amperios): ")
-
-            calculadora = FabricaCalculadoraOhm.crear_calculadora(tipo)
-            resultado = calculadora.calcular(valor1, valor2)
-
-            print(f"El resultado del cálculo de {tipo} es: {resultado:.2f}")
-        else:
+        entrada = _OPCIONES.get(opcion)
+        if entrada is None:
+            if opcion == "4":
+                print("Gracias por usar la calculadora de la Ley de Ohm. ¡Hasta luego!")
+                break
             print("Opción no válida. Por favor, seleccione una opción del 1 al 4.")
+            continue
+
+        tipo, mensaje1, mensaje2 = entrada
+        valor1 = obtener_entrada(mensaje1)
+        valor2 = obtener_entrada(mensaje2)
+
+        resultado = _CALCULADORAS[tipo](valor1, valor2)
+
+        print(f"El resultado del cálculo de {tipo} es: {resultado:.2f}")
 
 if __name__ == "__main__":
     main()
@@ -1,35 +1,34 @@
 # ley_ohm.py
 
-from abc import ABC, abstractmethod
-
-class CalculadoraOhm(ABC):
-    @abstractmethod
-    def calcular(self, *args):
-        pass
-
-class CalculadorVoltaje(CalculadoraOhm):
-    def calcular(self, corriente: float, resistencia: float) -> float:
-        return corriente * resistencia
-
-class CalculadorCorriente(CalculadoraOhm):
-    def calcular(self, voltaje: float, resistencia: float) -> float:
-        return voltaje / resistencia
-
-class CalculadorResistencia(CalculadoraOhm):
-    def calcular(self, voltaje: float, corriente: float) -> float:
-        return voltaje / corriente
-
-class FabricaCalculadoraOhm:
-    @staticmethod
-    def crear_calculadora(tipo: str) -> CalculadoraOhm:
-        if tipo == "voltaje":
-            return CalculadorVoltaje()
-        elif tipo == "corriente":
-            return CalculadorCorriente()
-        elif tipo == "resistencia":
-            return CalculadorResistencia()
-        else:
-            raise ValueError("Tipo de calculadora no válido")
+import argparse
+import re
+
+def calcular_voltaje(corriente: float, resistencia: float) -> float:
+    return corriente * resistencia
+
+def calcular_corriente(voltaje: float, resistencia: float) -> float:
+    return voltaje / resistencia
+
+def calcular_resistencia(voltaje: float, corriente: float) -> float:
+    return voltaje / corriente
+
+_CALCULADORAS = {
+    "voltaje": calcular_voltaje,
+    "corriente": calcular_corriente,
+    "resistencia": calcular_resistencia,
+}
+
+_NUMERO_RE = re.compile(r'^\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*$')
+
+_MENSAJE_CORRIENTE = "Ingrese la corriente (en amperios): "
+_MENSAJE_RESISTENCIA = "Ingrese la resistencia (en ohmios): "
+_MENSAJE_VOLTAJE = "Ingrese el voltaje (en voltios): "
+
+_OPCIONES = {
+    "1": ("voltaje", _MENSAJE_CORRIENTE, _MENSAJE_RESISTENCIA),
+    "2": ("corriente", _MENSAJE_VOLTAJE, _MENSAJE_RESISTENCIA),
+    "3": ("resistencia", _MENSAJE_VOLTAJE, _MENSAJE_CORRIENTE),
+}
 
 def mostrar_menu():
     print("\nCalculadora de la Ley de Ohm")
@@ -40,40 +39,58 @@ def mostrar_menu():
 
 def obtener_entrada(mensaje: str) -> float:
     while True:
+        entrada = input(mensaje)
+        if _NUMERO_RE.match(entrada):
+            return float(entrada)
+        print("Por favor, ingrese un número válido.")
+
+def _crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Calculadora de la Ley de Ohm")
+    parser.add_argument("--batch", metavar="ARCHIVO.csv",
+                        help="procesa un archivo CSV de mediciones en lugar de mostrar el menú")
+    parser.add_argument("--tipo", choices=tuple(_CALCULADORAS), default="voltaje",
+                        help="tipo de cálculo a realizar con --batch (por defecto: voltaje)")
+    return parser
+
+def procesar_lote(ruta: str, tipo: str):
+    # Se importa aquí para que el modo interactivo no dependa de numpy ni numba
+    from ohm_batch import calcular_lote, leer_csv
+
+    valores1, valores2 = leer_csv(ruta)
+    for resultado in calcular_lote(tipo, valores1, valores2):
+        print(f"{resultado:.2f}")
+
+def main(argv=None):
+    parser = _crear_parser()
+    args = parser.parse_args(argv)
+    if args.batch:
         try:
-            return float(input(mensaje))
-        except ValueError:
-            print("Por favor, ingrese un número válido.")
+            procesar_lote(args.batch, args.tipo)
+        except ImportError:
+            parser.error("--batch requiere numpy y numba (pip install numpy numba)")
+        except (OSError, ValueError) as e:
+            parser.error(f"no se pudo procesar {args.batch}: {e}")
+        return
 
-def main():
     while True:
         mostrar_menu()
         opcion = input("Seleccione una opción (1-4): ")
 
-        if opcion == "4":
-            print("Gracias por usar la calculadora de la Ley de Ohm. ¡Hasta luego!")
-            break
-
-        if opcion in ["1", "2", "3"]:
-            if opcion == "1":
-                tipo = "voltaje"
-                valor1 = obtener_entrada("Ingrese la corriente (en amperios): ")
-                valor2 = obtener_entrada("Ingrese la resistencia (en ohmios): ")
-            elif opcion == "2":
-                tipo = "corriente"
-                valor1 = obtener_entrada("Ingrese el voltaje (en voltios): ")
-                valor2 = obtener_entrada("Ingrese la resistencia (en ohmios): ")
-            else:
-                tipo = "resistencia"
-                valor1 = obtener_entrada("Ingrese el voltaje (en voltios): ")
-                valor2 = obtener_entrada("Ingrese la corriente (en amperios): ")
-
-            calculadora = FabricaCalculadoraOhm.crear_calculadora(tipo)
-            resultado = calculadora.calcular(valor1, valor2)
-
-            print(f"El resultado del cálculo de {tipo} es: {resultado:.2f}")
-        else:
+        entrada = _OPCIONES.get(opcion)
+        if entrada is None:
+            if opcion == "4":
+                print("Gracias por usar la calculadora de la Ley de Ohm. ¡Hasta luego!")
+                break
             print("Opción no válida. Por favor, seleccione una opción del 1 al 4.")
+            continue
+
+        tipo, mensaje1, mensaje2 = entrada
+        valor1 = obtener_entrada(mensaje1)
+        valor2 = obtener_entrada(mensaje2)
+
+        resultado = _CALCULADORAS[tipo](valor1, valor2)
+
+        print(f"El resultado del cálculo de {tipo} es: {resultado:.2f}")
 
 if __name__ == "__main__":
     main()
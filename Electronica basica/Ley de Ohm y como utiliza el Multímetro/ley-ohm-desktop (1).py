@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-from abc import ABC, abstractmethod
 import sys
 import os
 
@@ -28,9 +27,30 @@ Posibles modificaciones futuras:
 - Incluir un modo de tema oscuro para la interfaz.
 """
 
-# [Las clases CalculadoraOhm, CalculadorVoltaje, CalculadorCorriente, CalculadorResistencia y FabricaCalculadoraOhm 
+# [Las funciones calcular_voltaje, calcular_corriente, calcular_resistencia y la tabla _CALCULADORAS
 # permanecen sin cambios, por lo que se han omitido para brevedad]
 
+# Tipos de cálculo que se muestran en el Combobox
+_TIPOS = ("Voltaje", "Corriente", "Resistencia")
+
+# Unidad del resultado y etiquetas de los campos de entrada para cada tipo de cálculo
+_UNIDADES = {"voltaje": "V", "corriente": "A", "resistencia": "Ω"}
+_ETIQUETAS = {
+    "voltaje": ("Corriente (A):", "Resistencia (Ω):"),
+    "corriente": ("Voltaje (V):", "Resistencia (Ω):"),
+    "resistencia": ("Voltaje (V):", "Corriente (A):"),
+}
+
+# Ruta del ícono de la aplicación, resuelta una sola vez al importar el módulo
+if getattr(sys, 'frozen', False):
+    # Si es un ejecutable creado por PyInstaller
+    _APPLICATION_PATH = sys._MEIPASS
+else:
+    _APPLICATION_PATH = os.path.dirname(os.path.abspath(__file__))
+
+_ICONO_PATH = os.path.join(_APPLICATION_PATH, "icono.ico")
+_ICONO_EXISTE = os.path.exists(_ICONO_PATH)
+
 class AplicacionLeyOhm(tk.Tk):
     """
     Clase principal de la aplicación que maneja la interfaz gráfica y la lógica de la calculadora.
@@ -45,21 +65,18 @@ class AplicacionLeyOhm(tk.Tk):
         self.geometry("400x300")
         self.configure(bg='#f0f0f0')  # Color de fondo para toda la aplicación
         
-        # Centrar la ventana en la pantalla
-        self.center_window()
+        style = ttk.Style(self)
+        style.theme_use('clam')  # Usar un tema más moderno
         
         # Establecer el ícono de la aplicación
-        if getattr(sys, 'frozen', False):
-            # Si es un ejecutable creado por PyInstaller
-            application_path = sys._MEIPASS
-        else:
-            application_path = os.path.dirname(os.path.abspath(__file__))
-        
-        icon_path = os.path.join(application_path, "icono.ico")
-        if os.path.exists(icon_path):
-            self.iconbitmap(icon_path)
+        if _ICONO_EXISTE:
+            self.iconbitmap(_ICONO_PATH)
         
         self.crear_widgets()
+        
+        # Centrar la ventana en la pantalla una vez colocados los widgets,
+        # así Tk calcula la geometría una sola vez
+        self.center_window()
     
     def center_window(self):
         """
@@ -81,16 +98,13 @@ class AplicacionLeyOhm(tk.Tk):
         - Implementar un diseño más elaborado con frames y grids.
         - Añadir iconos a los botones para mejorar la experiencia visual.
         """
-        style = ttk.Style()
-        style.theme_use('clam')  # Usar un tema más moderno
-        
         main_frame = ttk.Frame(self, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
         
         # Combobox para seleccionar el tipo de cálculo
-        self.tipo_calculo = ttk.Combobox(main_frame, values=["Voltaje", "Corriente", "Resistencia"], state="readonly")
+        self.tipo_calculo = ttk.Combobox(main_frame, values=_TIPOS, state="readonly")
         self.tipo_calculo.set("Voltaje")
         self.tipo_calculo.grid(row=0, column=0, columnspan=2, pady=10, padx=10, sticky="ew")
         self.tipo_calculo.bind("<<ComboboxSelected>>", self.actualizar_etiquetas)
@@ -121,16 +135,9 @@ class AplicacionLeyOhm(tk.Tk):
         """
         Actualiza las etiquetas de los campos de entrada según el tipo de cálculo seleccionado.
         """
-        tipo = self.tipo_calculo.get()
-        if tipo == "Voltaje":
-            self.etiqueta1.config(text="Corriente (A):")
-            self.etiqueta2.config(text="Resistencia (Ω):")
-        elif tipo == "Corriente":
-            self.etiqueta1.config(text="Voltaje (V):")
-            self.etiqueta2.config(text="Resistencia (Ω):")
-        else:  # Resistencia
-            self.etiqueta1.config(text="Voltaje (V):")
-            self.etiqueta2.config(text="Corriente (A):")
+        texto1, texto2 = _ETIQUETAS[self.tipo_calculo.get().lower()]
+        self.etiqueta1.config(text=texto1)
+        self.etiqueta2.config(text=texto2)
     
     def calcular(self):
         """
@@ -146,10 +153,12 @@ class AplicacionLeyOhm(tk.Tk):
             valor1 = float(self.entrada1.get())
             valor2 = float(self.entrada2.get())
             
-            calculadora = FabricaCalculadoraOhm.crear_calculadora(tipo)
-            resultado = calculadora.calcular(valor1, valor2)
+            calcular_valor = _CALCULADORAS.get(tipo.lower())
+            if calcular_valor is None:
+                raise ValueError("Tipo de calculadora no válido")
+            resultado = calcular_valor(valor1, valor2)
             
-            unidad = "V" if tipo == "Voltaje" else "A" if tipo == "Corriente" else "Ω"
+            unidad = _UNIDADES[tipo.lower()]
             self.resultado.config(text=f"{tipo}: {resultado:.2f} {unidad}")
         except ValueError:
             self.resultado.config(text="Error: Ingrese valores numéricos válidos")
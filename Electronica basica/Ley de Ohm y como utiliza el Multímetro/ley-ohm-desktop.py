@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-from abc import ABC, abstractmethod
 
 """
 Calculadora de la Ley de Ohm - Aplicación de Escritorio Multiplataforma
@@ -20,92 +19,54 @@ Posibles modificaciones futuras:
 - Incluir un modo de tema oscuro para la interfaz.
 """
 
-class CalculadoraOhm(ABC):
-    """
-    Clase base abstracta para todas las calculadoras de la Ley de Ohm.
-    
-    Esta clase define la interfaz común para todos los tipos de cálculos.
-    Siguiendo el principio ISP, mantenemos esta interfaz simple y enfocada.
-    """
-    
-    @abstractmethod
-    def calcular(self, *args):
-        """
-        Método abstracto para realizar el cálculo.
-        
-        Cada subclase debe implementar este método según su tipo de cálculo específico.
-        """
-        pass
-
-class CalculadorVoltaje(CalculadoraOhm):
+def calcular_voltaje(corriente: float, resistencia: float) -> float:
     """
     Calcula el voltaje usando la Ley de Ohm: V = I * R
+    
+    :param corriente: Corriente en amperios (A)
+    :param resistencia: Resistencia en ohmios (Ω)
+    :return: Voltaje en voltios (V)
     """
-    def calcular(self, corriente: float, resistencia: float) -> float:
-        """
-        Calcula el voltaje dada la corriente y la resistencia.
-        
-        :param corriente: Corriente en amperios (A)
-        :param resistencia: Resistencia en ohmios (Ω)
-        :return: Voltaje en voltios (V)
-        """
-        return corriente * resistencia
+    return corriente * resistencia
 
-class CalculadorCorriente(CalculadoraOhm):
+def calcular_corriente(voltaje: float, resistencia: float) -> float:
     """
     Calcula la corriente usando la Ley de Ohm: I = V / R
+    
+    :param voltaje: Voltaje en voltios (V)
+    :param resistencia: Resistencia en ohmios (Ω)
+    :return: Corriente en amperios (A)
     """
-    def calcular(self, voltaje: float, resistencia: float) -> float:
-        """
-        Calcula la corriente dado el voltaje y la resistencia.
-        
-        :param voltaje: Voltaje en voltios (V)
-        :param resistencia: Resistencia en ohmios (Ω)
-        :return: Corriente en amperios (A)
-        """
-        return voltaje / resistencia
+    return voltaje / resistencia
 
-class CalculadorResistencia(CalculadoraOhm):
+def calcular_resistencia(voltaje: float, corriente: float) -> float:
     """
     Calcula la resistencia usando la Ley de Ohm: R = V / I
-    """
-    def calcular(self, voltaje: float, corriente: float) -> float:
-        """
-        Calcula la resistencia dado el voltaje y la corriente.
-        
-        :param voltaje: Voltaje en voltios (V)
-        :param corriente: Corriente en amperios (A)
-        :return: Resistencia en ohmios (Ω)
-        """
-        return voltaje / corriente
-
-class FabricaCalculadoraOhm:
-    """
-    Fábrica para crear instancias de calculadoras de la Ley de Ohm.
-    
-    Esta clase implementa el patrón de diseño Factory, permitiendo la creación
-    de diferentes tipos de calculadoras sin exponer la lógica de instanciación.
     
-    Posible modificación: Agregar más tipos de calculadoras relacionadas con electricidad.
+    :param voltaje: Voltaje en voltios (V)
+    :param corriente: Corriente en amperios (A)
+    :return: Resistencia en ohmios (Ω)
     """
-    
-    @staticmethod
-    def crear_calculadora(tipo: str) -> CalculadoraOhm:
-        """
-        Crea y retorna una instancia de la calculadora especificada.
-        
-        :param tipo: Tipo de calculadora a crear ("voltaje", "corriente", o "resistencia")
-        :return: Instancia de la calculadora correspondiente
-        :raises ValueError: Si se proporciona un tipo de calculadora no válido
-        """
-        if tipo == "Voltaje":
-            return CalculadorVoltaje()
-        elif tipo == "Corriente":
-            return CalculadorCorriente()
-        elif tipo == "Resistencia":
-            return CalculadorResistencia()
-        else:
-            raise ValueError("Tipo de calculadora no válido")
+    return voltaje / corriente
+
+# Tabla de cálculos disponibles. Para agregar un nuevo tipo de cálculo basta con
+# registrar aquí su función.
+_CALCULADORAS = {
+    "voltaje": calcular_voltaje,
+    "corriente": calcular_corriente,
+    "resistencia": calcular_resistencia,
+}
+
+# Tipos de cálculo que se muestran en el Combobox
+_TIPOS = ("Voltaje", "Corriente", "Resistencia")
+
+# Unidad del resultado y etiquetas de los campos de entrada para cada tipo de cálculo
+_UNIDADES = {"voltaje": "V", "corriente": "A", "resistencia": "Ω"}
+_ETIQUETAS = {
+    "voltaje": ("Corriente (A):", "Resistencia (Ω):"),
+    "corriente": ("Voltaje (V):", "Resistencia (Ω):"),
+    "resistencia": ("Voltaje (V):", "Corriente (A):"),
+}
 
 class AplicacionLeyOhm(tk.Tk):
     """
@@ -132,7 +93,7 @@ class AplicacionLeyOhm(tk.Tk):
         - Añadir iconos a los botones para mejorar la experiencia visual.
         """
         # Combobox para seleccionar el tipo de cálculo
-        self.tipo_calculo = ttk.Combobox(self, values=["Voltaje", "Corriente", "Resistencia"])
+        self.tipo_calculo = ttk.Combobox(self, values=_TIPOS)
         self.tipo_calculo.set("Voltaje")
         self.tipo_calculo.grid(row=0, column=0, columnspan=2, pady=10, padx=10, sticky="ew")
         self.tipo_calculo.bind("<<ComboboxSelected>>", self.actualizar_etiquetas)
@@ -163,16 +124,9 @@ class AplicacionLeyOhm(tk.Tk):
         """
         Actualiza las etiquetas de los campos de entrada según el tipo de cálculo seleccionado.
         """
-        tipo = self.tipo_calculo.get()
-        if tipo == "Voltaje":
-            self.etiqueta1.config(text="Corriente (A):")
-            self.etiqueta2.config(text="Resistencia (Ω):")
-        elif tipo == "Corriente":
-            self.etiqueta1.config(text="Voltaje (V):")
-            self.etiqueta2.config(text="Resistencia (Ω):")
-        else:  # Resistencia
-            self.etiqueta1.config(text="Voltaje (V):")
-            self.etiqueta2.config(text="Corriente (A):")
+        texto1, texto2 = _ETIQUETAS[self.tipo_calculo.get().lower()]
+        self.etiqueta1.config(text=texto1)
+        self.etiqueta2.config(text=texto2)
     
     def calcular(self):
         """
@@ -188,10 +142,12 @@ class AplicacionLeyOhm(tk.Tk):
             valor1 = float(self.entrada1.get())
             valor2 = float(self.entrada2.get())
             
-            calculadora = FabricaCalculadoraOhm.crear_calculadora(tipo)
-            resultado = calculadora.calcular(valor1, valor2)
+            calcular_valor = _CALCULADORAS.get(tipo.lower())
+            if calcular_valor is None:
+                raise ValueError("Tipo de calculadora no válido")
+            resultado = calcular_valor(valor1, valor2)
             
-            unidad = "V" if tipo == "Voltaje" else "A" if tipo == "Corriente" else "Ω"
+            unidad = _UNIDADES[tipo.lower()]
             self.resultado.config(text=f"{tipo}: {resultado:.2f} {unidad}")
         except ValueError as e:
             self.resultado.config(text="Error: Ingrese valores numéricos válidos")
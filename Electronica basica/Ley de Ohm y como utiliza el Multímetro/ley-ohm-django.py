@@ -27,52 +27,35 @@
 # calculadora/views.py
 from django.shortcuts import render
 from django.http import JsonResponse
-from abc import ABC, abstractmethod
+import operator
 
-class CalculadoraOhm(ABC):
-    @abstractmethod
-    def calcular(self, *args):
-        pass
-
-class CalculadorVoltaje(CalculadoraOhm):
-    def calcular(self, corriente: float, resistencia: float) -> float:
-        return corriente * resistencia
-
-class CalculadorCorriente(CalculadoraOhm):
-    def calcular(self, voltaje: float, resistencia: float) -> float:
-        return voltaje / resistencia
-
-class CalculadorResistencia(CalculadoraOhm):
-    def calcular(self, voltaje: float, corriente: float) -> float:
-        return voltaje / corriente
-
-class FabricaCalculadoraOhm:
-    @staticmethod
-    def crear_calculadora(tipo: str) -> CalculadoraOhm:
-        if tipo == "voltaje":
-            return CalculadorVoltaje()
-        elif tipo == "corriente":
-            return CalculadorCorriente()
-        elif tipo == "resistencia":
-            return CalculadorResistencia()
-        else:
-            raise ValueError("Tipo de calculadora no válido")
+# V = I * R, I = V / R, R = V / I
+_CALCULADORAS = {
+    "voltaje": operator.mul,
+    "corriente": operator.truediv,
+    "resistencia": operator.truediv,
+}
 
 def index(request):
     return render(request, 'calculadora/index.html')
 
 def calcular(request):
     if request.method == 'POST':
-        tipo = request.POST.get('tipo')
-        valor1 = float(request.POST.get('valor1', 0))
-        valor2 = float(request.POST.get('valor2', 0))
+        calcular_valor = _CALCULADORAS.get(request.POST.get('tipo'))
+        if calcular_valor is None:
+            return JsonResponse({'error': 'Tipo de calculadora no válido'}, status=400)
+
+        try:
+            valor1 = float(request.POST.get('valor1', 0))
+            valor2 = float(request.POST.get('valor2', 0))
+        except ValueError:
+            return JsonResponse({'error': 'Ingrese valores numéricos válidos'}, status=400)
 
         try:
-            calculadora = FabricaCalculadoraOhm.crear_calculadora(tipo)
-            resultado = calculadora.calcular(valor1, valor2)
-            return JsonResponse({'resultado': f"{resultado:.2f}"})
-        except ValueError as e:
-            return JsonResponse({'error': str(e)}, status=400)
+            resultado = calcular_valor(valor1, valor2)
+        except ZeroDivisionError:
+            return JsonResponse({'error': 'No se puede dividir por cero'}, status=400)
+        return JsonResponse({'resultado': format(resultado, '.2f')})
     
     return JsonResponse({'error': 'Método no permitido'}, status=405)
 
@@ -0,0 +1,132 @@
+# ohm_batch.py
+
+"""
+Cálculos de la Ley de Ohm por lotes.
+
+Este módulo permite procesar muchas mediciones a la vez (por ejemplo, un barrido
+de resistencias o un archivo CSV con mediciones) en lugar de calcular un solo
+valor por vez como hacen las calculadoras interactivas.
+
+Las funciones de cálculo se compilan con Numba. La primera ejecución compila el
+código y lo guarda en caché (cache=True), por lo que las siguientes ejecuciones
+arrancan sin volver a compilar.
+
+Dependencias opcionales: numpy y numba (pip install -r requirements-batch.txt en la
+raíz del repositorio)
+
+Formato del CSV: dos columnas numéricas separadas por coma, una medición por fila.
+El significado de cada columna depende del tipo de cálculo:
+- voltaje: corriente (A), resistencia (Ω)
+- corriente: voltaje (V), resistencia (Ω)
+- resistencia: voltaje (V), corriente (A)
+"""
+
+import warnings
+
+import numpy as np
+from numba import njit, prange
+
+# Solo las optimizaciones de fastmath que no suponen valores finitos: con
+# fastmath=True (que incluye nnan/ninf) dividir por cero daría resultados
+# indefinidos en lugar de inf o nan.
+_FASTMATH = {"contract", "reassoc", "arcp"}
+
+_MENSAJE_FORMA = "Los valores deben ser dos listas de una dimensión y del mismo tamaño"
+
+@njit(cache=True)
+def _validar_forma(valores1: np.ndarray, valores2: np.ndarray) -> None:
+    """
+    Verifica que los dos arreglos sean unidimensionales y del mismo tamaño.
+    Las funciones compiladas no verifican los límites de los arreglos.
+
+    :raises ValueError: Si los arreglos no tienen la misma forma
+    """
+    if valores1.ndim != 1 or valores2.ndim != 1 or valores1.shape[0] != valores2.shape[0]:
+        raise ValueError(_MENSAJE_FORMA)
+
+@njit(cache=True, fastmath=_FASTMATH, parallel=True)
+def voltajes(corrientes: np.ndarray, resistencias: np.ndarray) -> np.ndarray:
+    """
+    Calcula el voltaje de cada medición: V = I * R
+
+    :param corrientes: Corrientes en amperios (A)
+    :param resistencias: Resistencias en ohmios (Ω)
+    :return: Voltajes en voltios (V)
+    """
+    _validar_forma(corrientes, resistencias)
+    resultado = np.empty(corrientes.shape, dtype=np.float64)
+    for k in prange(corrientes.shape[0]):
+        resultado[k] = corrientes[k] * resistencias[k]
+    return resultado
+
+@njit(cache=True, fastmath=_FASTMATH, parallel=True)
+def corrientes(voltajes: np.ndarray, resistencias: np.ndarray) -> np.ndarray:
+    """
+    Calcula la corriente de cada medición: I = V / R
+
+    :param voltajes: Voltajes en voltios (V)
+    :param resistencias: Resistencias en ohmios (Ω)
+    :return: Corrientes en amperios (A)
+    """
+    _validar_forma(voltajes, resistencias)
+    resultado = np.empty(voltajes.shape, dtype=np.float64)
+    for k in prange(voltajes.shape[0]):
+        resultado[k] = voltajes[k] / resistencias[k]
+    return resultado
+
+@njit(cache=True, fastmath=_FASTMATH, parallel=True)
+def resistencias(voltajes: np.ndarray, corrientes: np.ndarray) -> np.ndarray:
+    """
+    Calcula la resistencia de cada medición: R = V / I
+
+    :param voltajes: Voltajes en voltios (V)
+    :param corrientes: Corrientes en amperios (A)
+    :return: Resistencias en ohmios (Ω)
+    """
+    _validar_forma(voltajes, corrientes)
+    resultado = np.empty(voltajes.shape, dtype=np.float64)
+    for k in prange(voltajes.shape[0]):
+        resultado[k] = voltajes[k] / corrientes[k]
+    return resultado
+
+_CALCULOS_LOTE = {
+    "voltaje": voltajes,
+    "corriente": corrientes,
+    "resistencia": resistencias,
+}
+
+def leer_csv(ruta: str) -> tuple:
+    """
+    Lee un archivo CSV de mediciones con dos columnas numéricas.
+
+    :param ruta: Ruta del archivo CSV
+    :return: Tupla (valores1, valores2) con las dos columnas como arreglos float64
+    :raises ValueError: Si el archivo está vacío o no tiene exactamente dos columnas
+    """
+    with warnings.catch_warnings():
+        # loadtxt solo avisa con un UserWarning si el archivo no tiene datos
+        warnings.simplefilter("ignore", UserWarning)
+        datos = np.loadtxt(ruta, delimiter=",", dtype=np.float64, ndmin=2)
+    if datos.size == 0:
+        raise ValueError("El archivo CSV está vacío")
+    if datos.shape[1] != 2:
+        raise ValueError("El archivo CSV debe tener exactamente dos columnas")
+    return np.ascontiguousarray(datos[:, 0]), np.ascontiguousarray(datos[:, 1])
+
+def calcular_lote(tipo: str, valores1: np.ndarray, valores2: np.ndarray) -> np.ndarray:
+    """
+    Realiza el cálculo indicado sobre todas las mediciones.
+
+    :param tipo: Tipo de cálculo ("voltaje", "corriente", o "resistencia")
+    :param valores1: Primer valor de cada medición
+    :param valores2: Segundo valor de cada medición
+    :return: Resultado de cada medición
+    :raises ValueError: Si el tipo de cálculo no es válido o los valores no tienen
+        la misma forma
+    """
+    try:
+        calculo = _CALCULOS_LOTE[tipo]
+    except KeyError:
+        raise ValueError("Tipo de calculadora no válido")
+
+    return calculo(np.ascontiguousarray(valores1, dtype=np.float64), np.ascontiguousarray(valores2, dtype=np.float64))
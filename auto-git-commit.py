@@ -1,54 +1,528 @@
 import os
+import re
+import shlex
+import signal
+import subprocess
+import sys
+import threading
 import time
-from git import Repo
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.observers.polling import PollingObserver
+from watchdog.events import FileSystemEventHandler, RegexMatchingEventHandler
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:  # Solo existe en Linux; en otros sistemas se usa watchdog
+    INotify = None
 
 # Configura estos valores
 REPO_PATH = 'D:/UDEMY/audrino-practica'
 COMMIT_MESSAGE = 'Auto-commit: Actualización de código'
 GITHUB_REMOTE = 'origin'
 BRANCH_NAME = 'main'
-IGNORED_EXTENSIONS = ['.git', '.gitignore', '.vscode', '.idea']  # Extensiones o carpetas a ignorar
+IGNORED_DIRS = ['.git', '.vscode', '.idea']  # Carpetas a ignorar
+IGNORED_FILES = ['.gitignore']  # Archivos a ignorar
+DEBOUNCE_SECONDS = 0.5  # Tiempo sin cambios antes de hacer commit
+MAX_WAIT_SECONDS = 5  # Espera máxima desde el primer cambio de una ráfaga
+PUSH_INTERVAL_SECONDS = 30  # Cada cuánto se suben los commits pendientes
+PUSH_MAX_PENDING = 10  # Commits pendientes que fuerzan un push inmediato
+MAX_PATHS_PER_COMMIT = 200  # Con más archivos cambiados se revisa todo el árbol
+SSH_CONTROL_PERSIST = '10m'  # Tiempo que la conexión SSH queda abierta entre pushes
+PUSH_RETRIES = 3  # Reintentos de un push que falló por un error de red
+UNTRACKED_INTERVAL_SECONDS = 300  # Cada cuánto se agregan archivos nuevos (None: nunca)
+
+# Ruta del repositorio normalizada una sola vez. Todas las vigilancias parten de
+# aquí, así que las rutas de los eventos empiezan siempre con _REPO_PREFIX.
+_REPO_DIR = os.path.normpath(REPO_PATH)
+_REPO_PREFIX = os.path.join(_REPO_DIR, "")
+
+def _ruta_relativa(ruta):
+    # Basta con quitar el prefijo; os.path.relpath normalizaría ambas rutas y
+    # consultaría el directorio actual en cada evento
+    if ruta.startswith(_REPO_PREFIX):
+        return ruta[len(_REPO_PREFIX):]
+    return os.path.relpath(ruta, _REPO_DIR)
+
+def _git(*args, env=None):
+    # Ejecuta un comando de git en el repositorio; lanza CalledProcessError si falla.
+    # Las rutas vienen de los eventos del sistema de archivos: con --literal-pathspecs
+    # git no interpreta comodines (`[ab].txt`) ni la magia de un `:` inicial.
+    comando = ["git", "--literal-pathspecs", "-C", _REPO_DIR, *args]
+    return subprocess.run(comando, check=True, capture_output=True, text=True, env=env)
+
+def _entorno_push():
+    # Con un remoto SSH, cada push abriría una conexión nueva (TCP + handshake SSH).
+    # ControlMaster de OpenSSH deja la conexión abierta SSH_CONTROL_PERSIST y los
+    # pushes siguientes la reutilizan. No se usa en Windows (su OpenSSH no lo
+    # soporta) ni si el usuario ya configuró su propio comando SSH (GIT_SSH_COMMAND,
+    # GIT_SSH o core.sshCommand), porque GIT_SSH_COMMAND tendría prioridad sobre él.
+    ssh_dir = os.path.join(os.path.expanduser("~"), ".ssh")
+    if os.name == "nt" or "GIT_SSH_COMMAND" in os.environ or "GIT_SSH" in os.environ:
+        return None
+    if not os.path.isdir(ssh_dir):
+        return None
+    try:
+        if _git("config", "core.sshCommand").stdout.strip():
+            return None
+    except subprocess.CalledProcessError:
+        pass  # git config termina con error si la opción no está definida
+    opciones = [
+        "ControlMaster=auto",
+        "ControlPath=" + os.path.join(ssh_dir, "cm-%C"),
+        "ControlPersist=" + SSH_CONTROL_PERSIST,
+    ]
+    comando = "ssh " + " ".join("-o " + shlex.quote(opcion) for opcion in opciones)
+    return dict(os.environ, GIT_SSH_COMMAND=comando)
+
+_PUSH_ENV = _entorno_push()
+
+# `git status` refresca el índice y para eso toma .git/index.lock aunque solo esté
+# leyendo. Sin ese lock opcional no choca con el editor u otras herramientas que
+# estén usando git en el mismo repositorio.
+_STATUS_ENV = dict(os.environ, GIT_OPTIONAL_LOCKS="0")
 
-repo = Repo(REPO_PATH)
+# Errores de push transitorios (red caída, timeouts) que vale la pena reintentar.
+# Los errores de autenticación o un push rechazado no se reintentan.
+_ERRORES_DE_RED = re.compile(
+    r"Could not resolve host|Connection timed out|Connection refused|Connection reset"
+    r"|Operation timed out|Network is unreachable|Failed to connect|early EOF"
+    r"|remote end hung up unexpectedly|RPC failed|SSL_ERROR|GnuTLS recv error",
+    re.IGNORECASE,
+)
+
+def _rutas_de_status(salida):
+    # Extrae las rutas de `git status --porcelain -z`. En los renombres la ruta
+    # original viene en la entrada siguiente y no hace falta agregarla.
+    rutas = []
+    entradas = iter(salida.split("\0"))
+    for entrada in entradas:
+        if not entrada:
+            continue
+        rutas.append(entrada[3:])
+        if entrada[0] in "RC":
+            next(entradas, None)
+    return rutas
+
+# Un guardado genera un evento de modificación por cada write() del editor, pero
+# uno solo de cierre. watchdog solo informa cierres en Linux; en otros sistemas
+# se sigue usando on_modified.
+_EVENTOS_DE_CIERRE = sys.platform.startswith("linux")
+
+# Rutas ignoradas: cualquier cosa dentro de IGNORED_DIRS y los archivos de IGNORED_FILES
+_IGNORED_REGEXES = [
+    r".*[\\/](?:{})(?:[\\/].*)?$".format("|".join(re.escape(d) for d in IGNORED_DIRS)),
+    r".*[\\/](?:{})$".format("|".join(re.escape(f) for f in IGNORED_FILES)),
+]
+
+class GitAutoCommit(RegexMatchingEventHandler):
+    def __init__(self):
+        # watchdog descarta las rutas ignoradas y los directorios antes de llamar a on_modified
+        super().__init__(ignore_regexes=_IGNORED_REGEXES, ignore_directories=True)
+        self._timer = None
+        self._inicio_rafaga = None
+        self._timer_lock = threading.Lock()
+        self._cambios = set()
+        self._pase_completo = False
+        # El sondeo no informa cierres aunque esté en Linux (ver vigilar_con_sondeo)
+        self.eventos_de_cierre = _EVENTOS_DE_CIERRE
+        self._git_lock = threading.Lock()
+        self._commits_pendientes = 0
+        self._push_fallido = False
+        self._push_lock = threading.Lock()
+        self._push_ahora = threading.Event()
+        self._detenido = threading.Event()
+        self._hilo_push = threading.Thread(target=self._bucle_push, daemon=True)
+        self._hilo_push.start()
+        if UNTRACKED_INTERVAL_SECONDS is not None:
+            threading.Thread(target=self._bucle_no_rastreados, daemon=True).start()
 
-class GitAutoCommit(FileSystemEventHandler):
     def on_modified(self, event):
-        if not event.is_directory:
-            file_path = event.src_path
-            _, file_extension = os.path.splitext(file_path)
-            
-            # Comprueba si el archivo o su extensión no están en la lista de ignorados
-            if not any(ignored in file_path for ignored in IGNORED_EXTENSIONS):
-                print(f"Archivo modificado: {file_path}")
-                self.stage_commit_and_push()
+        if not self.eventos_de_cierre:
+            print(f"Archivo modificado: {event.src_path}")
+            self.programar_commit(event.src_path)
+
+    def on_closed(self, event):
+        print(f"Archivo modificado: {event.src_path}")
+        self.programar_commit(event.src_path)
+
+    def on_created(self, event):
+        print(f"Archivo creado: {event.src_path}")
+        self.programar_commit(event.src_path)
 
-    def stage_commit_and_push(self):
+    def on_deleted(self, event):
+        print(f"Archivo eliminado: {event.src_path}")
+        self.programar_commit(event.src_path)
+
+    def on_moved(self, event):
+        print(f"Archivo movido: {event.src_path} -> {event.dest_path}")
+        self.programar_commit(event.src_path, event.dest_path)
+
+    def programar_commit(self, *rutas):
+        # Agrupa una ráfaga de cambios en un solo commit: cada evento reinicia el
+        # temporizador, pero nunca se espera más de MAX_WAIT_SECONDS desde el primero
+        with self._timer_lock:
+            self._cambios.update(_ruta_relativa(ruta) for ruta in rutas)
+            ahora = time.monotonic()
+            if self._timer is None:
+                self._inicio_rafaga = ahora
+            else:
+                self._timer.cancel()
+            espera = min(DEBOUNCE_SECONDS, self._inicio_rafaga + MAX_WAIT_SECONDS - ahora)
+            timer = threading.Timer(max(espera, 0), self._vaciar)
+            timer.args = (timer,)
+            timer.daemon = True
+            self._timer = timer
+            timer.start()
+
+    def programar_pase_completo(self):
+        # Para cambios que no se pueden reducir a una lista de rutas (p. ej. una
+        # carpeta movida fuera del repositorio): la próxima ráfaga revisa todo el árbol
+        with self._timer_lock:
+            self._pase_completo = True
+        self.programar_commit()
+
+    def _vaciar(self, timer=None):
+        with self._timer_lock:
+            # Un temporizador cancelado que ya había empezado a ejecutarse no debe
+            # hacer commit: el temporizador nuevo se encarga
+            if timer is not None and self._timer is not timer:
+                return
+            pendiente = self._timer is not None
+            if pendiente:
+                self._timer.cancel()
+            self._timer = None
+            cambios, self._cambios = self._cambios, set()
+            if self._pase_completo:
+                # Sin rutas, _stage_and_commit revisa todo el árbol
+                cambios, self._pase_completo = set(), False
+        if pendiente:
+            # Al detener el script se espera al commit en curso en lugar de reprogramar
+            self.stage_and_commit(cambios, esperar=timer is None)
+
+    def detener(self):
+        # Hace commit de la última ráfaga y sube todo lo pendiente antes de salir
+        self._vaciar()
+        if UNTRACKED_INTERVAL_SECONDS is not None:
+            self.stage_and_commit(esperar=True, incluir_no_rastreados=True)
+        self._detenido.set()
+        self._push_ahora.set()
+        self._hilo_push.join()
+        # Si el hilo ya estaba subiendo cuando llegaron los últimos commits,
+        # salió del bucle sin incluirlos
+        self.push_pending()
+
+    def stage_and_commit(self, cambios=(), esperar=False, incluir_no_rastreados=False):
+        # Solo una operación de git a la vez: dos commits simultáneos chocan en
+        # .git/index.lock. Si ya hay uno en curso, estos cambios pasan a la próxima ráfaga.
+        if not self._git_lock.acquire(blocking=esperar):
+            with self._timer_lock:
+                if cambios:
+                    self._cambios.update(cambios)
+                else:
+                    self._pase_completo = True
+            self.programar_commit()
+            return
+        try:
+            self._stage_and_commit(cambios, incluir_no_rastreados)
+        finally:
+            self._git_lock.release()
+
+    def _stage_and_commit(self, cambios, incluir_no_rastreados):
+        # Solo se revisan los archivos que cambiaron en la ráfaga en lugar de todo el
+        # árbol; si son demasiados para la línea de comandos se revisa todo
+        pathspec = ["--", *cambios] if 0 < len(cambios) <= MAX_PATHS_PER_COMMIT else []
+        # Normalmente solo se agregan archivos ya rastreados: así git no calcula el
+        # hash de cada archivo generado (builds, .hex, etc.) en cada ráfaga. Los
+        # archivos nuevos se agregan cada UNTRACKED_INTERVAL_SECONDS.
+        if incluir_no_rastreados:
+            no_rastreados, modo_add = "--untracked-files=normal", "-A"
+        else:
+            no_rastreados, modo_add = "--untracked-files=no", "-u"
         try:
-            # Stage all changes
-            repo.git.add(A=True)
+            # Si el árbol de trabajo no cambió (p. ej. el editor guardó sin modificar
+            # nada o el archivo está ignorado) no hay nada que agregar ni subir.
+            # status también descarta los temporales que ya no existen.
+            salida = _git("status", "--porcelain", "-z", no_rastreados, *pathspec, env=_STATUS_ENV).stdout
+            rutas = _rutas_de_status(salida)
+            if not rutas:
+                return
+
+            # Stage the changed files
+            if pathspec:
+                _git("add", modo_add, "--", *rutas)
+            else:
+                _git("add", modo_add)
             
             # Commit
-            repo.index.commit(COMMIT_MESSAGE)
-            
-            # Push
-            origin = repo.remote(name=GITHUB_REMOTE)
-            origin.push(BRANCH_NAME)
-            
-            print("Cambios subidos a GitHub exitosamente.")
-        except Exception as e:
-            print(f"Error al subir cambios: {str(e)}")
+            _git("commit", "-m", COMMIT_MESSAGE)
+        except subprocess.CalledProcessError as e:
+            print(f"Error al hacer commit: {(e.stderr or e.stdout).strip()}")
+            return
 
-if __name__ == "__main__":
-    event_handler = GitAutoCommit()
-    observer = Observer()
-    observer.schedule(event_handler, path=REPO_PATH, recursive=True)
+        print("Commit local creado.")
+        with self._push_lock:
+            self._commits_pendientes += 1
+            # Si el último push falló, se vuelve a intentar junto con este commit
+            if self._commits_pendientes >= PUSH_MAX_PENDING or self._push_fallido:
+                self._push_ahora.set()
+
+    def _bucle_no_rastreados(self):
+        while not self._detenido.wait(UNTRACKED_INTERVAL_SECONDS):
+            self.stage_and_commit(esperar=True, incluir_no_rastreados=True)
+
+    def _bucle_push(self):
+        # El push es lo más costoso (red, negociación, empaquetado), así que se
+        # suben varios commits juntos cada PUSH_INTERVAL_SECONDS
+        while not self._detenido.is_set():
+            self._push_ahora.wait(PUSH_INTERVAL_SECONDS)
+            self._push_ahora.clear()
+            self.push_pending()
+
+    def push_pending(self):
+        with self._push_lock:
+            pendientes = self._commits_pendientes
+            self._commits_pendientes = 0
+        if not pendientes:
+            return
+
+        for intento in range(1, PUSH_RETRIES + 2):
+            try:
+                _git("push", GITHUB_REMOTE, BRANCH_NAME, env=_PUSH_ENV)
+                break
+            except subprocess.CalledProcessError as e:
+                error = e.stderr.strip()
+                if intento <= PUSH_RETRIES and _ERRORES_DE_RED.search(error):
+                    espera = 2 ** intento
+                    print(f"Error de red al subir cambios, reintentando en {espera} s: {error}")
+                    time.sleep(espera)
+                    continue
+
+                # Los commits quedan pendientes para el próximo push
+                with self._push_lock:
+                    self._commits_pendientes += pendientes
+                    self._push_fallido = True
+                print(f"Error al subir cambios: {error}")
+                return
+
+        with self._push_lock:
+            self._push_fallido = False
+        print(f"{pendientes} commit(s) subidos a GitHub exitosamente.")
+
+class _CarpetasDePrimerNivel(FileSystemEventHandler):
+    # Mantiene una vigilancia recursiva por carpeta de primer nivel. Cada vigilancia
+    # queda atada a la ruta con la que se creó, así que al renombrar o borrar una
+    # carpeta se quita la vigilancia vieja y se crea una para la ruta nueva.
+    def __init__(self, observer, event_handler):
+        super().__init__()
+        self._observer = observer
+        self._event_handler = event_handler
+        self._vigilancias = {}
+
+    def vigilar(self, carpeta):
+        # Si la carpeta se borró y se volvió a crear, schedule() devolvería la
+        # vigilancia vieja, que ya no recibe eventos
+        self.dejar_de_vigilar(carpeta)
+        self._vigilancias[carpeta] = self._observer.schedule(self._event_handler, path=carpeta, recursive=True)
+
+    def dejar_de_vigilar(self, carpeta):
+        vigilancia = self._vigilancias.pop(carpeta, None)
+        if vigilancia is not None:
+            try:
+                self._observer.unschedule(vigilancia)
+            except KeyError:
+                # El observador ya la había quitado
+                pass
+
+    def on_created(self, event):
+        if event.is_directory and os.path.basename(event.src_path) not in IGNORED_DIRS:
+            self.vigilar(event.src_path)
+
+    def on_deleted(self, event):
+        # En Windows no se sabe si lo borrado era una carpeta, así que no se mira
+        # event.is_directory
+        self.dejar_de_vigilar(event.src_path)
+
+    def on_moved(self, event):
+        if event.src_path in self._vigilancias:
+            self.dejar_de_vigilar(event.src_path)
+            # Los archivos de la carpeta movida no generan eventos propios; se revisa
+            # todo el árbol para registrarlos como eliminados
+            print(f"Carpeta movida: {event.src_path} -> {event.dest_path}")
+            self._event_handler.programar_pase_completo()
+        if event.is_directory and os.path.basename(event.dest_path) not in IGNORED_DIRS:
+            self.vigilar(event.dest_path)
+
+def vigilar_repositorio(observer, event_handler):
+    # Se vigila la raíz sin recursión (archivos de primer nivel) y cada carpeta de
+    # primer nivel con recursión, salvo IGNORED_DIRS. Así el sistema operativo no
+    # genera eventos por cada objeto que git escribe en .git durante un commit.
+    observer.schedule(event_handler, path=_REPO_DIR, recursive=False)
+    carpetas = _CarpetasDePrimerNivel(observer, event_handler)
+    observer.schedule(carpetas, path=_REPO_DIR, recursive=False)
+    for entrada in os.scandir(_REPO_DIR):
+        if entrada.is_dir() and entrada.name not in IGNORED_DIRS:
+            carpetas.vigilar(entrada.path)
+
+def vigilar_con_sondeo(event_handler):
+    # Último recurso si no se puede vigilar todo el árbol con inotify (límite de
+    # vigilancias, carpetas sin permiso). El Observer de watchdog también usa
+    # inotify en Linux y fallaría igual, así que se revisa el árbol periódicamente.
+    observer = PollingObserver()
+    event_handler.eventos_de_cierre = False
+    vigilar_repositorio(observer, event_handler)
     observer.start()
+    return observer
 
-    try:
+class _VigilanteInotify:
+    # En Linux se lee inotify directamente: cada read() entrega de una vez todos los
+    # eventos acumulados y se registran juntos, sin crear un objeto de watchdog por
+    # evento. inotify no es recursivo, así que se agrega una vigilancia por carpeta
+    # (salvo IGNORED_DIRS) y se suman las carpetas nuevas a medida que aparecen.
+    def __init__(self, event_handler):
+        self._event_handler = event_handler
+        self._inotify = INotify()
+        # CLOSE_WRITE en lugar de MODIFY: un evento por guardado y no uno por write().
+        # MOVED_TO cubre a los editores que escriben un temporal y lo renombran.
+        self._mascara = flags.CLOSE_WRITE | flags.CREATE | flags.DELETE | flags.MOVED_FROM | flags.MOVED_TO
+        self._carpetas = {}
+        # Si inotify falla mientras se ejecuta, se cambia a este observador
+        self.observer = None
+        try:
+            self.vigilar(_REPO_DIR)
+            if not self._carpetas:
+                raise OSError(f"No se pudo vigilar {_REPO_DIR}")
+        except OSError:
+            self._inotify.close()
+            raise
+
+    def vigilar(self, carpeta, archivos=None):
+        # Si se pasa la lista `archivos`, se le agregan los archivos que ya hay en
+        # las carpetas recorridas
+        for raiz, subcarpetas, nombres in os.walk(carpeta):
+            subcarpetas[:] = [d for d in subcarpetas if d not in IGNORED_DIRS]
+            if archivos is not None:
+                archivos.extend(os.path.join(raiz, n) for n in nombres if n not in IGNORED_FILES)
+            # Cualquier otro error (sin permiso, sin vigilancias disponibles) se
+            # propaga: seguir sin vigilar una carpeta dejaría de hacer commit de
+            # sus archivos sin aviso
+            try:
+                self._carpetas[self._inotify.add_watch(raiz, self._mascara)] = raiz
+            except FileNotFoundError:
+                # La carpeta se borró mientras se recorría
+                pass
+
+    def dejar_de_vigilar(self, carpeta):
+        prefijo = os.path.join(carpeta, "")
+        for wd, ruta in list(self._carpetas.items()):
+            if ruta == carpeta or ruta.startswith(prefijo):
+                del self._carpetas[wd]
+                try:
+                    self._inotify.rm_watch(wd)
+                except OSError:
+                    # inotify ya la quitó
+                    pass
+
+    def start(self):
+        threading.Thread(target=self._leer, daemon=True).start()
+
+    def _leer(self):
         while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
+            try:
+                self._procesar(self._inotify.read())
+            except OSError as e:
+                print(f"No se puede seguir usando inotify, se revisarán los archivos periódicamente: {str(e)}")
+                self._inotify.close()
+                self.observer = vigilar_con_sondeo(self._event_handler)
+                # Los cambios de este lote y los anteriores al sondeo se perdieron
+                self._event_handler.programar_pase_completo()
+                return
+            except Exception as e:
+                # Un error no debe terminar el hilo: se dejarían de registrar cambios
+                # sin aviso. Se espera un poco para no repetirlo en un bucle.
+                print(f"Error al procesar los eventos de inotify: {str(e)}")
+                time.sleep(1)
+
+    def _procesar(self, eventos):
+        rutas = []
+        pase_completo = False
+        for evento in eventos:
+            if evento.mask & flags.IGNORED:
+                # La carpeta vigilada fue eliminada
+                self._carpetas.pop(evento.wd, None)
+                continue
+            carpeta = self._carpetas.get(evento.wd)
+            if carpeta is None or evento.name in IGNORED_DIRS or evento.name in IGNORED_FILES:
+                continue
+            ruta = os.path.join(carpeta, evento.name)
+            if evento.mask & flags.ISDIR:
+                if evento.mask & (flags.CREATE | flags.MOVED_TO):
+                    # Los archivos que ya contiene una carpeta movida (o los creados
+                    # antes de vigilarla) no generan eventos propios
+                    self.vigilar(ruta, rutas)
+                elif evento.mask & flags.MOVED_FROM:
+                    # inotify tampoco informa los archivos de la carpeta que se fue;
+                    # se revisa todo el árbol para registrarlos como eliminados
+                    print(f"Carpeta movida: {ruta}")
+                    self.dejar_de_vigilar(ruta)
+                    pase_completo = True
+                continue
+            if evento.mask & flags.CREATE:
+                # Solo interesa para carpetas; el archivo nuevo llega con CLOSE_WRITE
+                continue
+            rutas.append(ruta)
+
+        if rutas:
+            for ruta in dict.fromkeys(rutas):
+                print(f"Archivo modificado: {ruta}")
+            self._event_handler.programar_commit(*rutas)
+        if pase_completo:
+            self._event_handler.programar_pase_completo()
+
+if __name__ == "__main__":
+    event_handler = GitAutoCommit()
+    vigilante = None
+    observer = None
+    if INotify is not None:
+        try:
+            vigilante = _VigilanteInotify(event_handler)
+            vigilante.start()
+        except OSError as e:
+            # Por ejemplo, si se alcanzó el límite de vigilancias de inotify
+            print(f"No se pudo usar inotify, se revisarán los archivos periódicamente: {str(e)}")
+            observer = vigilar_con_sondeo(event_handler)
+    else:
+        observer = Observer()
+        vigilar_repositorio(observer, event_handler)
+        try:
+            observer.start()
+        except OSError as e:
+            # En Linux sin inotify_simple, watchdog también usa inotify
+            print(f"No se pudo vigilar el repositorio, se revisarán los archivos periódicamente: {str(e)}")
+            observer.stop()
+            observer = vigilar_con_sondeo(event_handler)
+
+    # Se espera sin despertar periódicamente hasta recibir Ctrl+C o SIGTERM.
+    # En Windows un wait sin timeout no se interrumpe con Ctrl+C, así que allí
+    # se revisa cada segundo.
+    detenido = threading.Event()
+
+    def detener(signum, frame):
+        # La primera señal cierra ordenadamente; una segunda (por ejemplo, si
+        # el último push se queda colgado) vuelve al comportamiento por defecto
+        # y fuerza la salida.
+        detenido.set()
+        por_defecto = signal.default_int_handler if signum == signal.SIGINT else signal.SIG_DFL
+        signal.signal(signum, por_defecto)
+
+    signal.signal(signal.SIGINT, detener)
+    signal.signal(signal.SIGTERM, detener)
+    espera = 1 if os.name == "nt" else None
+    while not detenido.wait(espera):
+        pass
+
+    if vigilante is not None:
+        observer = vigilante.observer
+    if observer is not None:
         observer.stop()
-    observer.join()
+        observer.join()
+    event_handler.detener()